@@ -0,0 +1,95 @@
+"""Pairwise proximity kernel used by the violation engine.
+
+`pairs_below` returns the indices of all (person, forklift) centre pairs
+closer than a threshold.  When Numba is installed the search runs as a
+compiled loop that never materialises the full pairwise difference array;
+otherwise a NumPy broadcasting version is used.
+
+The kernel is deliberately single-threaded: it is called concurrently from
+request threads, and Numba's fallback ``workqueue`` threading layer aborts
+the process on concurrent use of parallel kernels.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np  # type: ignore
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+
+def _pairs_below_numpy(
+    p: np.ndarray, f: np.ndarray, thr2: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    diff = p[:, None, :] - f[None, :, :]
+    dist2 = (diff * diff).sum(axis=-1)
+    pi, fi = np.nonzero(dist2 < thr2)
+    return pi.astype(np.int32), fi.astype(np.int32)
+
+
+if njit is not None:
+
+    @njit(fastmath=True, cache=True)
+    def _pairs_below_numba(p, f, thr2):  # pragma: no cover - compiled
+        n_p = p.shape[0]
+        n_f = f.shape[0]
+        # First pass: count matches per person so each row knows where to
+        # write its pairs in the second pass.
+        counts = np.zeros(n_p, dtype=np.int64)
+        for i in range(n_p):
+            c = 0
+            for j in range(n_f):
+                dx = p[i, 0] - f[j, 0]
+                dy = p[i, 1] - f[j, 1]
+                if dx * dx + dy * dy < thr2:
+                    c += 1
+            counts[i] = c
+        offsets = np.zeros(n_p + 1, dtype=np.int64)
+        for i in range(n_p):
+            offsets[i + 1] = offsets[i] + counts[i]
+        pi = np.empty(offsets[n_p], dtype=np.int32)
+        fi = np.empty(offsets[n_p], dtype=np.int32)
+        for i in range(n_p):
+            k = offsets[i]
+            for j in range(n_f):
+                dx = p[i, 0] - f[j, 0]
+                dy = p[i, 1] - f[j, 1]
+                if dx * dx + dy * dy < thr2:
+                    pi[k] = i
+                    fi[k] = j
+                    k += 1
+        return pi, fi
+
+
+def pairs_below(
+    p: np.ndarray, f: np.ndarray, thr2: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find all point pairs whose squared distance is below ``thr2``.
+
+    Args:
+        p: ``(P, 2)`` array of points.
+        f: ``(F, 2)`` array of points.
+        thr2: Squared distance threshold.
+
+    Returns:
+        Two int32 arrays of equal length holding the row indices into ``p``
+        and ``f`` of each matching pair, ordered by ``p`` index then ``f``
+        index.
+    """
+    if njit is None:
+        return _pairs_below_numpy(p, f, thr2)
+    return _pairs_below_numba(
+        np.ascontiguousarray(p, dtype=np.float64),
+        np.ascontiguousarray(f, dtype=np.float64),
+        float(thr2),
+    )
+
+
+def warmup() -> None:
+    """Compile the Numba kernel, if available, so requests don't pay for it."""
+    points = np.zeros((1, 2), dtype=np.float64)
+    pairs_below(points, points, 1.0)
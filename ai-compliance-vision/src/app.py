@@ -16,15 +16,98 @@ from __future__ import annotations
 
 import io
 import os
-from pathlib import Path
-from typing import Any, Dict, List
+import threading
+from typing import Any, Union
 
-import cv2  # type: ignore
-import numpy as np  # type: ignore
 from flask import Flask, render_template_string, request, jsonify
+from werkzeug.datastructures import FileStorage
+
+from .service import ComplianceService
+
+
+# Simple HTML page, shared with the ASGI app
+PAGE_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>AI Compliance Vision</title>
+    <style>
+        body { font-family: sans-serif; margin: 2rem; }
+        .container { max-width: 600px; margin: auto; }
+        input[type=file] { display: block; margin-bottom: 1rem; }
+        button { padding: 0.5rem 1rem; margin-top: 0.5rem; }
+        pre { background: #f5f5f5; padding: 1rem; overflow-x: auto; }
+    </style>
+</head>
+<body>
+<div class="container">
+    <h1>AI Compliance Vision</h1>
+    <p>Upload an image or capture a photo to detect potential safety and compliance issues.</p>
+    <form id="upload-form" enctype="multipart/form-data">
+        <input type="file" name="image" accept="image/*" />
+        <button type="submit">Upload Image</button>
+    </form>
+    <button id="capture-button">Capture Photo</button>
+    <h2>Result</h2>
+    <pre id="result"></pre>
+</div>
+<script>
+    // Upload image via AJAX
+    document.getElementById('upload-form').addEventListener('submit', async (e) => {
+        e.preventDefault();
+        const formData = new FormData(e.target);
+        const res = await fetch('/upload', { method: 'POST', body: formData });
+        const data = await res.json();
+        document.getElementById('result').textContent = JSON.stringify(data, null, 2);
+    });
+    // Capture photo from webcam and submit
+    document.getElementById('capture-button').addEventListener('click', async () => {
+        const res = await fetch('/capture', { method: 'POST' });
+        const data = await res.json();
+        document.getElementById('result').textContent = JSON.stringify(data, null, 2);
+    });
+</script>
+</body>
+</html>
+"""
+
+
+# Largest request body accepted by the app.
+MAX_UPLOAD_SIZE = 32 * 1024 * 1024
+
+# Uploads up to this size are read into a reused per-thread buffer; larger
+# ones are read with `file.read()` so that a single big upload does not pin
+# its size in memory for the lifetime of the thread.
+_UPLOAD_BUFFER_LIMIT = 8 * 1024 * 1024
+
+# Per-thread buffer that uploads are read into, see `_read_upload`.
+_upload_buffers = threading.local()
 
-from .detect import load_model, detect_image
-from .violation_engine import ViolationEngine
+
+def _read_upload(file: FileStorage) -> Union[bytes, memoryview]:
+    """Read an uploaded file into a per-thread buffer reused across requests.
+
+    The buffer is sized from the request's ``Content-Length``, which bounds
+    the size of any file in the body.  It is only reused by servers that
+    keep a pool of worker threads.  The returned view is only valid until
+    the next call on the same thread.
+    """
+    size = request.content_length
+    if not size or size > _UPLOAD_BUFFER_LIMIT or not hasattr(file.stream, "readinto"):
+        return file.read()
+    buf = getattr(_upload_buffers, "buf", None)
+    if buf is None or len(buf) < size:
+        buf = _upload_buffers.buf = bytearray(size)
+    view = memoryview(buf)
+    n = 0
+    while n < size:
+        count = file.stream.readinto(view[n:size])
+        if not count:
+            break
+        n += count
+    return view[:n]
 
 
 def create_app(weights_path: str = None, standards_dir: str = None) -> Flask:
@@ -32,94 +115,12 @@ def create_app(weights_path: str = None, standards_dir: str = None) -> Flask:
 
     This function loads the primary YOLO model from ``weights_path`` and
     optionally loads additional models for PPE or safety detection if
-    corresponding weight files are present in the ``models/`` directory.
+    corresponding weight files are present in the ``models/`` directory
+    (see `ComplianceService`).
     """
     app = Flask(__name__)
-
-    # Determine default paths
-    base_dir = Path(__file__).resolve().parent.parent
-    models_dir = base_dir / "models"
-    if weights_path is None:
-        # Use first file in models directory if available
-        weights_candidates = list(models_dir.glob("*.pt"))
-        if not weights_candidates:
-            raise FileNotFoundError(
-                "No model weights found in 'models/'. Please provide a weights file."
-            )
-        weights_path = str(weights_candidates[0])
-    if standards_dir is None:
-        standards_dir = str(base_dir / "standards")
-
-    # Load base model
-    base_model = load_model(str(weights_path))
-
-    # Discover optional external model weights
-    extra_weights = []
-    for name in [
-        "safety-detection-yolov8.pt",
-        "ppe_detection_yolo.pt",
-        "ppe_detection-yolov8.pt",
-    ]:
-        candidate = models_dir / name
-        if candidate.exists():
-            extra_weights.append(str(candidate))
-
-    # Load all models (base + external)
-    models: List[Any]
-    if extra_weights:
-        models = [base_model] + [load_model(w) for w in extra_weights]
-    else:
-        models = [base_model]
-
-    engine = ViolationEngine(standards_dir)
-
-    # Simple HTML page
-    PAGE_TEMPLATE = """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>AI Compliance Vision</title>
-        <style>
-            body { font-family: sans-serif; margin: 2rem; }
-            .container { max-width: 600px; margin: auto; }
-            input[type=file] { display: block; margin-bottom: 1rem; }
-            button { padding: 0.5rem 1rem; margin-top: 0.5rem; }
-            pre { background: #f5f5f5; padding: 1rem; overflow-x: auto; }
-        </style>
-    </head>
-    <body>
-    <div class="container">
-        <h1>AI Compliance Vision</h1>
-        <p>Upload an image or capture a photo to detect potential safety and compliance issues.</p>
-        <form id="upload-form" enctype="multipart/form-data">
-            <input type="file" name="image" accept="image/*" />
-            <button type="submit">Upload Image</button>
-        </form>
-        <button id="capture-button">Capture Photo</button>
-        <h2>Result</h2>
-        <pre id="result"></pre>
-    </div>
-    <script>
-        // Upload image via AJAX
-        document.getElementById('upload-form').addEventListener('submit', async (e) => {
-            e.preventDefault();
-            const formData = new FormData(e.target);
-            const res = await fetch('/upload', { method: 'POST', body: formData });
-            const data = await res.json();
-            document.getElementById('result').textContent = JSON.stringify(data, null, 2);
-        });
-        // Capture photo from webcam and submit
-        document.getElementById('capture-button').addEventListener('click', async () => {
-            const res = await fetch('/capture', { method: 'POST' });
-            const data = await res.json();
-            document.getElementById('result').textContent = JSON.stringify(data, null, 2);
-        });
-    </script>
-    </body>
-    </html>
-    """
+    app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_SIZE
+    service = ComplianceService(weights_path, standards_dir)
 
     @app.route("/")
     def index() -> Any:
@@ -130,29 +131,13 @@ def create_app(weights_path: str = None, standards_dir: str = None) -> Flask:
         file = request.files.get("image")
         if not file:
             return jsonify({"error": "No file provided."}), 400
-        # Read file into a numpy array
-        in_memory = file.read()
-        file_bytes = np.frombuffer(in_memory, dtype=np.uint8)
-        img = cv2.imdecode(file_bytes, cv2.IMREAD_COLOR)
-        if img is None:
-            return jsonify({"error": "Failed to decode image."}), 400
-        detections = detect_image(models, img)
-        violations = engine.evaluate(detections)
-        return jsonify({"detections": detections, "violations": violations})
+        payload, status = service.analyse_upload(_read_upload(file))
+        return jsonify(payload), status
 
     @app.route("/capture", methods=["POST"])
     def capture() -> Any:
-        # Attempt to open default camera
-        cap = cv2.VideoCapture(0)
-        if not cap or not cap.isOpened():
-            return jsonify({"error": "Unable to access camera."}), 500
-        ret, frame = cap.read()
-        cap.release()
-        if not ret:
-            return jsonify({"error": "Failed to capture frame."}), 500
-        detections = detect_image(models, frame)
-        violations = engine.evaluate(detections)
-        return jsonify({"detections": detections, "violations": violations})
+        payload, status = service.analyse_capture()
+        return jsonify(payload), status
 
     return app
 
@@ -0,0 +1,71 @@
+"""ASGI application serving the same endpoints as the Flask app.
+
+Uploads are received asynchronously and the blocking detection work runs in
+a thread pool, so concurrent requests reach the inference batcher together
+instead of queuing behind each other in the server.  Run it with::
+
+    uvicorn --factory src.asgi:create_asgi_app --workers 1 --http httptools
+
+Use a single worker: each worker process loads its own copy of the models.
+The ``YOLO_WEIGHTS`` and ``STANDARDS_DIR`` environment variables override
+the default paths, as for the Flask app.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Optional
+
+from fastapi import FastAPI, Request  # type: ignore
+from fastapi.concurrency import run_in_threadpool  # type: ignore
+from fastapi.responses import HTMLResponse, JSONResponse  # type: ignore
+from starlette.datastructures import UploadFile  # type: ignore
+
+from .app import MAX_UPLOAD_SIZE, PAGE_TEMPLATE
+from .service import ComplianceService
+
+
+def create_asgi_app(weights_path: Optional[str] = None, standards_dir: Optional[str] = None) -> FastAPI:
+    """Factory to create and configure the FastAPI app.
+
+    Arguments default to the ``YOLO_WEIGHTS`` and ``STANDARDS_DIR``
+    environment variables, then to the defaults of `ComplianceService`.
+    """
+    service = ComplianceService(
+        weights_path or os.environ.get("YOLO_WEIGHTS"),
+        standards_dir or os.environ.get("STANDARDS_DIR"),
+    )
+    app = FastAPI(title="AI Compliance Vision")
+
+    @app.get("/", response_class=HTMLResponse)
+    async def index() -> Any:
+        return PAGE_TEMPLATE
+
+    @app.post("/upload")
+    async def upload(request: Request) -> Any:
+        # Enforce the same request size limit as the Flask app; reject early
+        # when the declared length is too large, before parsing the form
+        too_large = JSONResponse({"error": "File too large."}, status_code=413)
+        content_length = request.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > MAX_UPLOAD_SIZE:
+            return too_large
+        form = await request.form()
+        try:
+            image = form.get("image")
+            if not isinstance(image, UploadFile):
+                return JSONResponse({"error": "No file provided."}, status_code=400)
+            # Read one byte past the limit to detect oversized chunked uploads
+            data = await image.read(MAX_UPLOAD_SIZE + 1)
+        finally:
+            await form.close()
+        if len(data) > MAX_UPLOAD_SIZE:
+            return too_large
+        payload, status = await run_in_threadpool(service.analyse_upload, data)
+        return JSONResponse(payload, status_code=status)
+
+    @app.post("/capture")
+    async def capture() -> Any:
+        payload, status = await run_in_threadpool(service.analyse_capture)
+        return JSONResponse(payload, status_code=status)
+
+    return app
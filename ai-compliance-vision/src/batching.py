@@ -0,0 +1,89 @@
+"""Micro-batching of inference requests.
+
+Each HTTP request carries a single image, so running detection directly in
+the request handler issues one small predict call per request and leaves the
+GPU mostly idle.  `InferenceBatcher` collects images submitted by concurrent
+requests on a queue and a background worker runs them through the models in
+a single batched call, resolving one future per request.
+"""
+
+from __future__ import annotations
+
+import functools
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, List, Sequence, Tuple
+
+import numpy as np  # type: ignore
+
+from .detect import MAX_BATCH, Detections, detect_batch, detect_batch_many
+
+
+class InferenceBatcher:
+    """Coalesce concurrent detection requests into batched predict calls."""
+
+    def __init__(
+        self,
+        models: Sequence[Any],
+        max_batch: int = MAX_BATCH,
+        max_wait_ms: float = 5.0,
+        conf_threshold: float = 0.25,
+    ) -> None:
+        self.models = models
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.conf_threshold = conf_threshold
+        # Bind the detection function once rather than dispatching on the
+        # number of models for every batch
+        if len(models) > 1:
+            self._detect_fn = functools.partial(detect_batch_many, models)
+        else:
+            self._detect_fn = functools.partial(detect_batch, models[0])
+        self._queue: "queue.Queue[Tuple[np.ndarray, Future]]" = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="inference-batcher", daemon=True
+        )
+
+    def start(self) -> None:
+        """Start the background worker thread."""
+        self._thread.start()
+
+    def submit(self, image: np.ndarray) -> Future:
+        """Queue an image for detection and return a future for its result."""
+        future: Future = Future()
+        self._queue.put((image, future))
+        return future
+
+    def detect(self, image: np.ndarray) -> Detections:
+        """Queue an image and block until its detections are available."""
+        return self.submit(image).result()
+
+    def _next_batch(self) -> List[Tuple[np.ndarray, Future]]:
+        # Block for the first item, then gather more until the batch is full
+        # or `max_wait` has elapsed.
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            images = [image for image, _ in batch]
+            try:
+                results = self._detect_fn(images, self.conf_threshold)
+            except Exception as exc:  # propagate to the waiting requests
+                for _, future in batch:
+                    future.set_exception(exc)
+                continue
+            for (_, future), detections in zip(batch, results):
+                future.set_result(detections)
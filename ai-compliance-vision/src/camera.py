@@ -0,0 +1,80 @@
+"""Persistent camera capture.
+
+Opening a `cv2.VideoCapture` initialises the camera driver, which can take
+hundreds of milliseconds.  `CameraStream` keeps the device open and reads
+frames continuously in a background thread, so a capture request only has to
+pick up the most recent frame.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Optional
+
+import cv2  # type: ignore
+import numpy as np  # type: ignore
+
+
+class CameraStream:
+    """Read frames from a camera in a background thread."""
+
+    def __init__(self, device: int = 0) -> None:
+        self.device = device
+        self._cap: Any = None
+        self._frame: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+        self._frame_ready = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> bool:
+        """Open the camera and start the reader thread if not yet running.
+
+        Returns:
+            ``True`` if the camera is available, ``False`` otherwise.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return True
+            cap = cv2.VideoCapture(self.device)
+            if not cap or not cap.isOpened():
+                return False
+            self._cap = cap
+            self._frame_ready.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="camera-reader", daemon=True
+            )
+            self._thread.start()
+        return True
+
+    def read(self, timeout: float = 1.0) -> Optional[np.ndarray]:
+        """Return the most recent frame.
+
+        Each frame is a fresh array owned by the caller; the reader thread
+        never writes into a frame once it has been published.
+
+        Args:
+            timeout: Seconds to wait for the first frame after `start`.
+
+        Returns:
+            The latest BGR frame, or ``None`` if no frame is available.
+        """
+        if not self._frame_ready.wait(timeout):
+            return None
+        with self._lock:
+            return self._frame
+
+    def _run(self) -> None:
+        cap = self._cap
+        while True:
+            ret, frame = cap.read()
+            if not ret:
+                break
+            with self._lock:
+                self._frame = frame
+            self._frame_ready.set()
+        # The camera was disconnected; drop the stale frame so the next
+        # request reopens the device.
+        cap.release()
+        with self._lock:
+            self._frame = None
+            self._frame_ready.clear()
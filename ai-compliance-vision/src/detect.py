@@ -1,49 +1,414 @@
 """Detection wrapper for YOLO models.
 
 This module provides helper functions to load a YOLO model and run detection on
-images.  It returns a list of detection dictionaries that can be passed into
-the violation engine to map conditions to potential regulatory citations.
+images.  It returns column-oriented detections (see `Detections`) that can be
+passed into the violation engine to map conditions to potential regulatory
+citations.
 """
 
 from __future__ import annotations
 
 import os
+import shutil
+import struct
+import tempfile
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Sequence, Union
+from typing import List, Dict, Any, Optional, Sequence, Set, Union
 
 import cv2  # type: ignore
 import numpy as np  # type: ignore
+import torch  # type: ignore
 from ultralytics import YOLO  # type: ignore
 
+try:
+    import PIL  # type: ignore
+    from PIL import Image  # type: ignore
+except ImportError:  # pragma: no cover - Pillow is an ultralytics dependency
+    Image = None
+
+# Resize with Pillow only when the AVX2-accelerated Pillow-SIMD fork is
+# installed (its version carries a ``.postN`` suffix) or when explicitly
+# requested with ``PILLOW_RESIZE=1``.  Stock Pillow antialiases when
+# downscaling and is far slower than `cv2.resize`.
+_PILLOW_RESIZE = Image is not None and (
+    ".post" in getattr(PIL, "__version__", "") or os.environ.get("PILLOW_RESIZE") == "1"
+)
+
+try:  # nvJPEG decoding on the GPU and NMS for merging ensemble results
+    from torchvision.io import ImageReadMode, decode_jpeg  # type: ignore
+    from torchvision.ops import batched_nms  # type: ignore
+except ImportError:  # pragma: no cover - torchvision is an ultralytics dependency
+    decode_jpeg = None
+    batched_nms = None
+
 from .hazard_conditions import CLASS_NAMES, CLASS_CONDITIONS
 
+# Detections for one image, stored column-wise rather than as one dict per
+# box: ``bboxes`` is an (N, 4) float32 array of xyxy coordinates in the
+# original image, ``confidences`` an (N,) float32 array, and ``class_names``
+# and ``conditions`` are lists of N strings.  Use `detections_to_list` to
+# obtain JSON-serialisable per-detection dictionaries.
+Detections = Dict[str, Any]
+
 _model_cache: Dict[str, YOLO] = {}
 
+# Models already passed through `warmup_model`.
+_warmed_models: Set[int] = set()
+
+# Per-thread scratch image reused by `draw_detections`.
+_draw_buffers = threading.local()
+
+# Whether JPEG uploads can be decoded on the GPU, see `decode_image`.
+_GPU_DECODE = decode_jpeg is not None and torch.cuda.is_available()
+
+# Per-model CUDA streams and the thread pool used to run several models
+# concurrently, created on first use.
+_stream_cache: Dict[int, Any] = {}
+_executor: Optional[ThreadPoolExecutor] = None
+
+# Inference image size; TensorRT engines are built for this fixed size.
+IMG_SIZE = 1024
+
+# Largest batch accepted by exported TensorRT engines.  `InferenceBatcher`
+# never groups more images than this into a single predict call.
+MAX_BATCH = 16
+
+# Extra arguments passed to `model.predict`.  On a CUDA device we run on the
+# first GPU in half precision so convolutions execute on Tensor Cores.
+_PREDICT_KWARGS: Dict[str, Any] = (
+    {"device": 0, "half": True} if torch.cuda.is_available() else {}
+)
+
+# Engines built by `export_engine` only accept `IMG_SIZE` inputs; all other
+# models keep the input size stored with their weights.
+_ENGINE_PREDICT_KWARGS: Dict[str, Any] = {**_PREDICT_KWARGS, "imgsz": IMG_SIZE}
+
+# Models loaded from engines built by `export_engine`, see `_predict_kwargs`.
+_engine_models: Set[int] = set()
+
+
+def export_engine(
+    weights_path: str,
+    half: bool = True,
+    int8: bool = False,
+    calib_data: Optional[str] = None,
+) -> str:
+    """Export PyTorch weights to a TensorRT engine stored next to the ``.pt``.
+
+    The engine is written to ``<name>.engine``, or ``<name>.int8.engine`` for
+    INT8 builds.  The export is performed only once; if the engine file
+    already exists its path is returned directly.  Engines are built with a
+    dynamic batch dimension of up to `MAX_BATCH` images so that batched
+    requests can share a single inference call.
+
+    Args:
+        weights_path: Path to the ``.pt`` weights file.
+        half: Build the engine in FP16.
+        int8: Build the engine in INT8.  Requires ``calib_data``.
+        calib_data: Dataset YAML providing calibration images for INT8.
+
+    Returns:
+        Path to the TensorRT engine file.
+    """
+    engine_path = Path(weights_path).with_suffix(".int8.engine" if int8 else ".engine")
+    if engine_path.exists():
+        return str(engine_path)
+    export_args: Dict[str, Any] = {
+        "format": "engine",
+        "half": half and not int8,
+        "imgsz": IMG_SIZE,
+        "dynamic": True,
+        "batch": MAX_BATCH,
+        "workspace": 4,
+    }
+    if int8:
+        if calib_data is None:
+            raise ValueError("INT8 export requires a calibration dataset.")
+        export_args.update(int8=True, data=calib_data)
+    _export_to(weights_path, engine_path, export_args)
+    return str(engine_path)
+
+
+def export_openvino(
+    weights_path: str, int8: bool = False, calib_data: Optional[str] = None
+) -> str:
+    """Export PyTorch weights to an OpenVINO model for CPU inference.
+
+    INT8 models run their convolutions with VNNI instructions on CPUs that
+    support them.  The model directory is written next to the ``.pt`` as
+    ``<name>_openvino_model`` or ``<name>_int8_openvino_model``.
+
+    Args:
+        weights_path: Path to the ``.pt`` weights file.
+        int8: Quantize the model to INT8.  Requires ``calib_data``.
+        calib_data: Dataset YAML providing calibration images for INT8.
+
+    Returns:
+        Path to the OpenVINO model directory.
+    """
+    path = Path(weights_path)
+    suffix = "_int8_openvino_model" if int8 else "_openvino_model"
+    model_dir = path.with_name(f"{path.stem}{suffix}")
+    if model_dir.exists():
+        return str(model_dir)
+    export_args: Dict[str, Any] = {"format": "openvino", "imgsz": IMG_SIZE, "dynamic": True}
+    if int8:
+        if calib_data is None:
+            raise ValueError("INT8 export requires a calibration dataset.")
+        export_args.update(int8=True, data=calib_data)
+    _export_to(weights_path, model_dir, export_args)
+    return str(model_dir)
+
+
+def _export_to(weights_path: str, target: Path, export_args: Dict[str, Any]) -> None:
+    """Export ``weights_path`` with ultralytics and move the result to ``target``.
 
-def load_model(weights_path: str) -> YOLO:
+    Ultralytics writes its output (and intermediate files such as ONNX
+    models) next to the weights under fixed names, so exports run on a
+    temporary copy of the weights to avoid overwriting other variants, e.g.
+    an FP16 ``.engine`` when building an INT8 one.
+    """
+    with tempfile.TemporaryDirectory(dir=target.parent) as tmp_dir:
+        tmp_weights = Path(tmp_dir) / Path(weights_path).name
+        shutil.copy2(weights_path, tmp_weights)
+        exported = YOLO(str(tmp_weights)).export(**export_args)
+        shutil.move(str(exported), str(target))
+
+
+def _find_int8_model(weights_path: str) -> Optional[str]:
+    """Return a pre-built INT8 model stored next to ``weights_path``, if any.
+
+    TensorRT engines are used on CUDA devices and OpenVINO models otherwise.
+    Both are produced by ``tools/quantize.py``.
+    """
+    path = Path(weights_path)
+    if torch.cuda.is_available():
+        candidate = path.with_suffix(".int8.engine")
+    else:
+        candidate = path.with_name(f"{path.stem}_int8_openvino_model")
+    return str(candidate) if candidate.exists() else None
+
+
+def load_model(
+    weights_path: str,
+    use_engine: Optional[bool] = None,
+    int8: bool = False,
+    calib_data: Optional[str] = None,
+) -> YOLO:
     """Load a YOLO model from the given weights file.
 
     Models are cached in `_model_cache` so repeated calls with the same path
-    will not reload weights from disk.
+    will not reload weights from disk.  A pre-built INT8 model next to the
+    ``.pt`` file (see `_find_int8_model`) is preferred when present.
+    Otherwise, when a CUDA device is available the ``.pt`` weights are
+    exported once to a TensorRT engine (see `export_engine`) and the engine
+    is loaded instead.  If the export fails, e.g. because TensorRT is not
+    installed, the PyTorch weights are used.
 
     Args:
-        weights_path: Path to the YOLO weights file.
+        weights_path: Path to the YOLO weights file (``.pt``, ``.engine`` or
+            an OpenVINO model directory).
+        use_engine: Whether to load a pre-built INT8 model or export and load
+            a TensorRT engine.  ``False`` always loads ``weights_path``
+            itself.  Defaults to using a pre-built INT8 model if present and
+            exporting an engine when CUDA is available.
+        int8: Build the engine in INT8 instead of FP16.
+        calib_data: Dataset YAML with calibration images for INT8 export.
 
     Returns:
         A loaded YOLO model.
+
+    Raises:
+        FileNotFoundError: If ``weights_path`` does not exist.
+        ValueError: If ``int8`` is set without ``calib_data``.
     """
     global _model_cache
     weights_path = str(Path(weights_path).resolve())
     if weights_path not in _model_cache:
         if not os.path.exists(weights_path):
             raise FileNotFoundError(f"Weights file '{weights_path}' not found.")
-        _model_cache[weights_path] = YOLO(weights_path)
+        # Validate here so that caller errors are not mistaken for a failed
+        # TensorRT export below
+        if int8 and calib_data is None:
+            raise ValueError("INT8 export requires a calibration dataset.")
+        model_path = weights_path
+        is_pt = Path(weights_path).suffix == ".pt"
+        prebuilt = _find_int8_model(weights_path) if is_pt and use_engine is not False else None
+        if use_engine is None:
+            use_engine = torch.cuda.is_available()
+        if prebuilt is not None:
+            model_path = prebuilt
+        elif use_engine and is_pt:
+            try:
+                model_path = export_engine(
+                    weights_path, half=not int8, int8=int8, calib_data=calib_data
+                )
+            except Exception as exc:  # pragma: no cover - depends on TensorRT
+                warnings.warn(
+                    f"TensorRT export failed for '{weights_path}' ({exc}); "
+                    "falling back to PyTorch weights."
+                )
+        model = YOLO(model_path, task="detect")
+        if model_path != weights_path and Path(model_path).suffix == ".engine":
+            _engine_models.add(id(model))
+        _model_cache[weights_path] = model
     return _model_cache[weights_path]
 
 
-def prepare_image(image: np.ndarray, max_size: int = 1024) -> np.ndarray:
+def warmup_model(model: YOLO, compile_model: bool = True) -> None:
+    """Prepare a loaded model for low-latency inference.
+
+    On CUDA devices this enables cuDNN autotuning and TF32 matmuls.  For
+    PyTorch weights the predictor's network is converted to the channels-last
+    memory format and, on PyTorch 2.x, compiled with `torch.compile`.  Dummy
+    batches shaped like those produced by `InferenceBatcher` are then run
+    through the model so that autotuning, compilation and TensorRT context
+    creation happen before the first real request rather than during it.
+    Calling this more than once for the same model is a no-op.
+
+    Args:
+        model: A model returned by `load_model`.
+        compile_model: Whether to compile PyTorch weights.
+    """
+    if id(model) in _warmed_models:
+        return
+    if torch.cuda.is_available():
+        torch.backends.cudnn.benchmark = True
+        torch.set_float32_matmul_precision("high")
+    # The first predict builds the predictor, which fuses Conv+BN layers
+    dummy = np.zeros((IMG_SIZE, IMG_SIZE, 3), dtype=np.uint8)
+    model.predict(source=dummy, verbose=False, **_predict_kwargs(model))
+    network = _predictor_network(model)
+    if torch.cuda.is_available() and network is not None:
+        # NHWC weights let cuDNN pick Tensor Core kernels.  This must happen
+        # after fusion, which needs NCHW weights.
+        network.to(memory_format=torch.channels_last)
+        if compile_model and hasattr(torch, "compile"):
+            # Dynamic shapes cover the varying batch sizes and letterboxed
+            # image shapes without recompiling.  CUDA graphs
+            # (mode="reduce-overhead") are avoided since they are re-recorded
+            # for every new shape and on every request thread.
+            model.predictor.model.model = torch.compile(network, dynamic=True)
+        # Exercise a square single image and a batch of letterboxed
+        # non-square images, as the batcher produces both
+        wide = np.zeros((IMG_SIZE // 2, IMG_SIZE, 3), dtype=np.uint8)
+        for batch in ([dummy], [wide, wide]):
+            model.predict(source=batch, verbose=False, **_predict_kwargs(model))
+    _warmed_models.add(id(model))
+
+
+def _predict_kwargs(model: YOLO) -> Dict[str, Any]:
+    """Return the extra `predict` arguments for a loaded model."""
+    if id(model) in _engine_models:
+        return _ENGINE_PREDICT_KWARGS
+    return _PREDICT_KWARGS
+
+
+def _predictor_network(model: YOLO) -> Optional[torch.nn.Module]:
+    """Return the PyTorch network run by the model's predictor, if any.
+
+    The predictor wraps a fused copy of the network in an ultralytics
+    ``AutoBackend``; TensorRT and OpenVINO backends have no such module.
+    """
+    backend = getattr(getattr(model, "predictor", None), "model", None)
+    network = getattr(backend, "model", None)
+    return network if isinstance(network, torch.nn.Module) else None
+
+
+def decode_image(data: Union[bytes, bytearray, memoryview]) -> Optional[np.ndarray]:
+    """Decode an encoded image file into a BGR numpy array.
+
+    JPEG data is decoded on the GPU with nvJPEG when torchvision and a CUDA
+    device are available, which is considerably faster than a CPU decode for
+    large photos.  Other formats, or any failure on the GPU path, fall back
+    to `cv2.imdecode`.  The EXIF orientation is applied in both cases.
+
+    Args:
+        data: Raw bytes of the encoded image.  A writable buffer such as a
+            ``bytearray`` avoids a copy on the GPU path.
+
+    Returns:
+        The decoded image, or ``None`` if it could not be decoded.
+    """
+    if _GPU_DECODE and data[:3] == b"\xff\xd8\xff":
+        try:
+            # torch.frombuffer needs a writable buffer
+            buf = bytearray(data) if isinstance(data, bytes) else data
+            rgb = decode_jpeg(
+                torch.frombuffer(buf, dtype=torch.uint8),
+                mode=ImageReadMode.RGB,
+                device="cuda",
+            )
+            # nvJPEG ignores EXIF metadata, so rotate like cv2.imdecode does
+            rgb = _apply_exif_orientation(rgb, _jpeg_orientation(data))
+            return rgb.flip(0).permute(1, 2, 0).contiguous().cpu().numpy()
+        except RuntimeError:
+            pass
+    file_bytes = np.frombuffer(data, dtype=np.uint8)
+    return cv2.imdecode(file_bytes, cv2.IMREAD_COLOR)
+
+
+def _jpeg_orientation(data: Union[bytes, bytearray, memoryview]) -> int:
+    """Return the EXIF Orientation tag (1-8) of JPEG data, or 1 if absent."""
+    pos = 2
+    end = len(data)
+    while pos + 4 <= end and data[pos] == 0xFF:
+        marker = data[pos + 1]
+        if marker == 0xDA:  # start of scan: no more metadata segments
+            break
+        (length,) = struct.unpack_from(">H", data, pos + 2)
+        segment = pos + 4
+        if marker == 0xE1 and bytes(data[segment:segment + 6]) == b"Exif\x00\x00":
+            tiff = segment + 6
+            order = bytes(data[tiff:tiff + 2])
+            if order not in (b"II", b"MM"):
+                return 1
+            fmt = "<" if order == b"II" else ">"
+            try:
+                (ifd_offset,) = struct.unpack_from(fmt + "I", data, tiff + 4)
+                ifd = tiff + ifd_offset
+                (count,) = struct.unpack_from(fmt + "H", data, ifd)
+                for i in range(count):
+                    entry = ifd + 2 + 12 * i
+                    tag, _, _, value = struct.unpack_from(fmt + "HHIH", data, entry)
+                    if tag == 0x0112:
+                        return value if 1 <= value <= 8 else 1
+            except struct.error:
+                pass
+            return 1
+        pos = segment + length - 2
+    return 1
+
+
+def _apply_exif_orientation(image: torch.Tensor, orientation: int) -> torch.Tensor:
+    """Transform a CHW image tensor so that it is displayed upright."""
+    if orientation == 2:
+        return image.flip(2)
+    if orientation == 3:
+        return image.flip(1, 2)
+    if orientation == 4:
+        return image.flip(1)
+    if orientation == 5:
+        return image.transpose(1, 2)
+    if orientation == 6:
+        return torch.rot90(image, -1, dims=(1, 2))
+    if orientation == 7:
+        return image.transpose(1, 2).flip(1, 2)
+    if orientation == 8:
+        return torch.rot90(image, 1, dims=(1, 2))
+    return image
+
+
+def prepare_image(image: np.ndarray, max_size: int = IMG_SIZE) -> np.ndarray:
     """Resize image while preserving aspect ratio.
 
+    Images that already fit within ``max_size`` are returned unchanged.
+    Resizing uses OpenCV, or Pillow for 8-bit colour images when Pillow-SIMD
+    is installed or ``PILLOW_RESIZE=1`` is set (see `_PILLOW_RESIZE`).
+
     Args:
         image: Input BGR image as a numpy array.
         max_size: Maximum side length for the resized image.
@@ -53,91 +418,281 @@ def prepare_image(image: np.ndarray, max_size: int = 1024) -> np.ndarray:
     """
     h, w = image.shape[:2]
     scale = min(max_size / max(h, w), 1.0)
+    if scale == 1.0:
+        return image
     new_w, new_h = int(w * scale), int(h * scale)
+    if _PILLOW_RESIZE and image.dtype == np.uint8 and image.ndim == 3 and image.shape[2] == 3:
+        # Resampling is per channel, so BGR data can be passed through as-is
+        resized = Image.fromarray(image).resize((new_w, new_h), Image.BILINEAR)
+        return np.asarray(resized)
     resized = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
     return resized
 
 
-def detect_image(model: Union[YOLO, Sequence[YOLO]], image: np.ndarray, conf_threshold: float = 0.25) -> List[Dict[str, Any]]:
-    """Run object detection on an image and return hazard conditions.
+def detect_one(model: YOLO, image: np.ndarray, conf_threshold: float = 0.25) -> Detections:
+    """Run object detection with a single model and return hazard conditions.
+
+    Unknown classes not present in `CLASS_NAMES` are mapped to their
+    original class names as conditions.
+
+    Args:
+        model: A loaded YOLO model.
+        image: BGR image as a numpy array.
+        conf_threshold: Confidence threshold to filter detections.
+
+    Returns:
+        The detections in the column layout described by `Detections`.
+    """
+    return detect_batch(model, [image], conf_threshold)[0]
+
+
+def detect_many(models: Sequence[YOLO], image: np.ndarray, conf_threshold: float = 0.25) -> Detections:
+    """Run object detection with several models and aggregate the results.
 
-    This function can accept a single YOLO model or a sequence of models.  If a
-    sequence is provided, detections from all models are aggregated.  Unknown
-    classes not present in `CLASS_NAMES` are mapped to their original
-    class names as conditions.
+    Overlapping detections of the same condition from different models are
+    merged (see `detect_batch_many`).
 
     Args:
-        model: A loaded YOLO model or a sequence of YOLO models.
+        models: A sequence of loaded YOLO models.
         image: BGR image as a numpy array.
         conf_threshold: Confidence threshold to filter detections.
 
     Returns:
-        A list of detection dictionaries containing bounding box coordinates,
-        class name, confidence score and underlying hazard condition.
+        The detections in the column layout described by `Detections`.
+    """
+    return detect_batch_many(models, [image], conf_threshold)[0]
+
+
+def detect_image(model: Union[YOLO, Sequence[YOLO]], image: np.ndarray, conf_threshold: float = 0.25) -> Detections:
+    """Run object detection on an image and return hazard conditions.
+
+    Convenience wrapper dispatching to `detect_one` or `detect_many`
+    depending on whether a single model or a sequence of models is given.
+    Callers that always use the same models should bind the appropriate
+    function once instead.
     """
-    # If multiple models are provided, aggregate detections from each
     if isinstance(model, Sequence) and not isinstance(model, YOLO):
-        all_detections: List[Dict[str, Any]] = []
-        for m in model:
-            all_detections.extend(detect_image(m, image, conf_threshold))
-        return all_detections
-
-    # Single model inference
-    prepared = prepare_image(image)
-    results = model.predict(source=prepared, verbose=False)
-    detections: List[Dict[str, Any]] = []
-    for result in results:
-        boxes = result.boxes
-        for box in boxes:
-            cls_id = int(box.cls.item())
-            score = float(box.conf.item())
-            if score < conf_threshold:
-                continue
-            if 0 <= cls_id < len(CLASS_NAMES):
-                class_name = CLASS_NAMES[cls_id]
-                condition = CLASS_CONDITIONS.get(class_name, class_name)
-            else:
-                # For classes outside our known list, use the raw class id
-                # returned by the model.  YOLO stores class names in
-                # result.names if available.
-                if hasattr(result, "names"):
-                    class_name = result.names.get(cls_id, str(cls_id))  # type: ignore
-                else:
-                    class_name = str(cls_id)
-                condition = class_name
-            # Extract bounding box coordinates relative to original image size
-            x1, y1, x2, y2 = box.xyxy[0].tolist()
-            h_ratio = image.shape[0] / prepared.shape[0]
-            w_ratio = image.shape[1] / prepared.shape[1]
-            orig_x1 = x1 * w_ratio
-            orig_y1 = y1 * h_ratio
-            orig_x2 = x2 * w_ratio
-            orig_y2 = y2 * h_ratio
-            detections.append({
-                "class_name": class_name,
-                "condition": condition,
-                "confidence": score,
-                "bbox": [orig_x1, orig_y1, orig_x2, orig_y2],
-            })
+        return detect_many(model, image, conf_threshold)
+    return detect_one(model, image, conf_threshold)
+
+
+def detect_batch(
+    model: YOLO,
+    images: Sequence[np.ndarray],
+    conf_threshold: float = 0.25,
+) -> List[Detections]:
+    """Run object detection on several images with one predict call.
+
+    Batching amortises per-call overhead on the GPU.  The number of images
+    should not exceed `MAX_BATCH`, the largest batch a TensorRT engine built
+    by `export_engine` accepts.
+
+    Args:
+        model: A loaded YOLO model.
+        images: BGR images as numpy arrays.
+        conf_threshold: Confidence threshold to filter detections.
+
+    Returns:
+        One set of detections per input image, in input order.
+    """
+    prepared = [prepare_image(image) for image in images]
+    results = model.predict(source=prepared, verbose=False, **_predict_kwargs(model))
+    return [
+        _extract_detections(result, image, prep, conf_threshold)
+        for result, image, prep in zip(results, images, prepared)
+    ]
+
+
+def detect_batch_many(
+    models: Sequence[YOLO],
+    images: Sequence[np.ndarray],
+    conf_threshold: float = 0.25,
+) -> List[Detections]:
+    """Run `detect_batch` with several models and aggregate the results.
+
+    The models run concurrently so their GPU work can overlap.  Models
+    trained on overlapping classes report the same object more than once,
+    so the merged boxes go through per-condition non-maximum suppression:
+    a box is dropped if it overlaps a higher-scoring box of the same
+    condition with an IoU above 0.5.
+
+    Args:
+        models: A sequence of loaded YOLO models.
+        images: BGR images as numpy arrays.
+        conf_threshold: Confidence threshold to filter detections.
+
+    Returns:
+        One set of detections per input image, in input order.
+    """
+    futures = [
+        _get_executor().submit(_detect_on_stream, m, images, conf_threshold)
+        for m in models
+    ]
+    per_model = [future.result() for future in futures]
+    # Merge the per-model results in model order
+    return [
+        _suppress_duplicates(_concat_detections(per_image))
+        for per_image in zip(*per_model)
+    ]
+
+
+def detections_to_list(detections: Detections) -> List[Dict[str, Any]]:
+    """Convert detections to a list of JSON-serialisable dictionaries.
+
+    Each dictionary contains the keys ``class_name``, ``condition``,
+    ``confidence`` and ``bbox``.
+    """
+    return [
+        {
+            "class_name": class_name,
+            "condition": condition,
+            "confidence": confidence,
+            "bbox": bbox,
+        }
+        for class_name, condition, confidence, bbox in zip(
+            detections["class_names"],
+            detections["conditions"],
+            detections["confidences"].tolist(),
+            detections["bboxes"].tolist(),
+        )
+    ]
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(thread_name_prefix="yolo-model")
+    return _executor
+
+
+def _detect_on_stream(
+    model: YOLO, images: Sequence[np.ndarray], conf_threshold: float
+) -> List[Detections]:
+    """Run `detect_batch` for one model on that model's own CUDA stream."""
+    if not torch.cuda.is_available():
+        return detect_batch(model, images, conf_threshold)
+    stream = _stream_cache.get(id(model))
+    if stream is None:
+        stream = _stream_cache[id(model)] = torch.cuda.Stream()
+    with torch.cuda.stream(stream):
+        detections = detect_batch(model, images, conf_threshold)
+    stream.synchronize()
     return detections
 
 
-def draw_detections(image: np.ndarray, detections: List[Dict[str, Any]]) -> np.ndarray:
+def _concat_detections(parts: Sequence[Detections]) -> Detections:
+    """Concatenate several sets of detections in order."""
+    return {
+        "bboxes": np.concatenate([p["bboxes"] for p in parts]),
+        "confidences": np.concatenate([p["confidences"] for p in parts]),
+        "class_names": [name for p in parts for name in p["class_names"]],
+        "conditions": [cond for p in parts for cond in p["conditions"]],
+    }
+
+
+def _select_detections(detections: Detections, index: np.ndarray) -> Detections:
+    """Return the detections at the given row indices."""
+    rows = index.tolist()
+    return {
+        "bboxes": detections["bboxes"][index],
+        "confidences": detections["confidences"][index],
+        "class_names": [detections["class_names"][i] for i in rows],
+        "conditions": [detections["conditions"][i] for i in rows],
+    }
+
+
+def _suppress_duplicates(detections: Detections, iou_threshold: float = 0.5) -> Detections:
+    """Apply per-condition non-maximum suppression to merged detections.
+
+    Boxes are grouped by hazard condition rather than class id, since class
+    ids are not comparable between models.  The surviving detections keep
+    their original order.
+    """
+    if len(detections["conditions"]) < 2 or batched_nms is None:
+        return detections
+    groups: Dict[str, int] = {}
+    idxs = torch.tensor([groups.setdefault(c, len(groups)) for c in detections["conditions"]])
+    keep = batched_nms(
+        torch.from_numpy(detections["bboxes"]),
+        torch.from_numpy(detections["confidences"]),
+        idxs,
+        iou_threshold,
+    )
+    return _select_detections(detections, np.sort(keep.numpy()))
+
+
+def _extract_detections(
+    result: Any, image: np.ndarray, prepared: np.ndarray, conf_threshold: float
+) -> Detections:
+    """Convert a single YOLO result into column-oriented detections."""
+    boxes = result.boxes
+    # Copy all boxes to the host at once instead of per detection
+    xyxy = boxes.xyxy.cpu().numpy()
+    conf = boxes.conf.cpu().numpy()
+    cls = boxes.cls.cpu().numpy().astype(np.int32)
+    keep = conf >= conf_threshold
+    # Scale bounding box coordinates back to the original image size
+    h_ratio = image.shape[0] / prepared.shape[0]
+    w_ratio = image.shape[1] / prepared.shape[1]
+    scale = np.array([w_ratio, h_ratio, w_ratio, h_ratio], dtype=np.float32)
+    bboxes = (xyxy[keep] * scale).astype(np.float32, copy=False)
+    names = getattr(result, "names", None)
+    class_names: List[str] = []
+    conditions: List[str] = []
+    for cls_id in cls[keep].tolist():
+        if 0 <= cls_id < len(CLASS_NAMES):
+            class_name = CLASS_NAMES[cls_id]
+            condition = CLASS_CONDITIONS.get(class_name, class_name)
+        else:
+            # For classes outside our known list, use the raw class id
+            # returned by the model.  YOLO stores class names in
+            # result.names if available.
+            if names is not None:
+                class_name = names.get(cls_id, str(cls_id))  # type: ignore
+            else:
+                class_name = str(cls_id)
+            condition = class_name
+        class_names.append(class_name)
+        conditions.append(condition)
+    return {
+        "bboxes": bboxes,
+        "confidences": conf[keep].astype(np.float32, copy=False),
+        "class_names": class_names,
+        "conditions": conditions,
+    }
+
+
+def draw_detections(
+    image: np.ndarray, detections: Detections, *, inplace: bool = False
+) -> np.ndarray:
     """Draw bounding boxes and labels on the image for visualisation.
 
+    Unless ``inplace`` is set, drawing happens on a per-thread scratch buffer
+    that is reused on the next call with an image of the same shape.  Callers
+    must copy the returned array if they need to keep it across frames.
+
     Args:
-        image: BGR image array.  This array will not be modified; a copy
-            is made internally.
-        detections: List of detection dictionaries as returned by
-            `detect_image`.
+        image: BGR image array.  This array is only modified if ``inplace``
+            is true.
+        detections: Detections as returned by `detect_image`.
+        inplace: Draw directly onto ``image`` instead of a copy.
 
     Returns:
-        A new image array with bounding boxes and labels drawn.
+        An image array with bounding boxes and labels drawn.
     """
-    draw = image.copy()
-    for det in detections:
-        x1, y1, x2, y2 = [int(coord) for coord in det["bbox"]]
-        label = f"{det['class_name']} {det['confidence']:.2f}"
+    if inplace:
+        draw = image
+    else:
+        draw = getattr(_draw_buffers, "scratch", None)
+        if draw is None or draw.shape != image.shape or draw.dtype != image.dtype:
+            draw = _draw_buffers.scratch = np.empty(image.shape, dtype=image.dtype)
+        np.copyto(draw, image)
+    for (x1, y1, x2, y2), class_name, confidence in zip(
+        detections["bboxes"].astype(np.int32).tolist(),
+        detections["class_names"],
+        detections["confidences"].tolist(),
+    ):
+        label = f"{class_name} {confidence:.2f}"
         # Draw box
         cv2.rectangle(draw, (x1, y1), (x2, y2), color=(0, 255, 0), thickness=2)
         # Draw label background
@@ -0,0 +1,125 @@
+"""Detection pipeline shared by the web frontends.
+
+`ComplianceService` owns the loaded models, the violation engine, the
+inference batcher, the camera and the upload cache.  The Flask app
+(`app.py`) and the ASGI app (`asgi.py`) only translate HTTP requests into
+calls on this class.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np  # type: ignore
+
+from .batching import InferenceBatcher
+from .camera import CameraStream
+from .detect import decode_image, detections_to_list, load_model, warmup_model
+from .utils import ResultCache, content_hash
+from .violation_engine import ViolationEngine
+
+
+class ComplianceService:
+    """Run hazard detection on uploaded or captured images."""
+
+    def __init__(self, weights_path: Optional[str] = None, standards_dir: Optional[str] = None) -> None:
+        """Load the models and rule engine.
+
+        The primary YOLO model is loaded from ``weights_path`` and additional
+        models for PPE or safety detection are loaded if corresponding weight
+        files are present in the ``models/`` directory.
+        """
+        # Determine default paths
+        base_dir = Path(__file__).resolve().parent.parent
+        models_dir = base_dir / "models"
+        if weights_path is None:
+            # Use first file in models directory if available
+            weights_candidates = list(models_dir.glob("*.pt"))
+            if not weights_candidates:
+                raise FileNotFoundError(
+                    "No model weights found in 'models/'. Please provide a weights file."
+                )
+            weights_path = str(weights_candidates[0])
+        if standards_dir is None:
+            standards_dir = str(base_dir / "standards")
+
+        # Load base model
+        base_model = load_model(str(weights_path))
+
+        # Discover optional external model weights
+        extra_weights = []
+        for name in [
+            "safety-detection-yolov8.pt",
+            "ppe_detection_yolo.pt",
+            "ppe_detection-yolov8.pt",
+        ]:
+            candidate = models_dir / name
+            if candidate.exists():
+                extra_weights.append(str(candidate))
+
+        # Load all models (base + external)
+        models: List[Any]
+        if extra_weights:
+            models = [base_model] + [load_model(w) for w in extra_weights]
+        else:
+            models = [base_model]
+
+        # Run a dummy inference through each model so the first request does
+        # not pay for autotuning and compilation
+        for model in models:
+            warmup_model(model)
+        self.models = models
+
+        self.engine = ViolationEngine(standards_dir)
+
+        # Requests share a single inference worker which batches images from
+        # concurrent requests into one predict call per model.
+        self.batcher = InferenceBatcher(models)
+        self.batcher.start()
+
+        # The camera is opened on the first capture request and then kept
+        # open, with frames read continuously in the background
+        self.camera = CameraStream(0)
+
+        # Repeated uploads of the same file are answered without inference
+        self.upload_cache = ResultCache()
+
+    def analyse(self, image: np.ndarray) -> Dict[str, Any]:
+        """Detect hazards in a BGR image and return the JSON report."""
+        detections = self.batcher.detect(image)
+        violations = self.engine.evaluate(detections)
+        return {"detections": detections_to_list(detections), "violations": violations}
+
+    def analyse_upload(self, data: Union[bytes, bytearray, memoryview]) -> Tuple[Dict[str, Any], int]:
+        """Decode an uploaded image file and analyse it.
+
+        ``data`` is not retained, so it may be a view of a reused buffer.
+
+        Returns:
+            The JSON payload and HTTP status code.
+        """
+        key = content_hash(data)
+        cached = self.upload_cache.get(key)
+        if cached is not None:
+            return cached, 200
+        img = decode_image(data)
+        if img is None:
+            return {"error": "Failed to decode image."}, 400
+        report = self.analyse(img)
+        self.upload_cache.put(key, report)
+        return report, 200
+
+    def analyse_capture(self) -> Tuple[Dict[str, Any], int]:
+        """Grab the latest camera frame and analyse it.
+
+        Returns:
+            The JSON payload and HTTP status code.
+        """
+        # Attempt to open default camera (no-op once it is running)
+        if not self.camera.start():
+            return {"error": "Unable to access camera."}, 500
+        frame = self.camera.read()
+        if frame is None:
+            return {"error": "Failed to capture frame."}, 500
+        return self.analyse(frame), 200
@@ -1,13 +1,21 @@
 """Utility functions for the AI Compliance Vision project.
 
 Currently includes helper functions to format detection outputs into a
-report‑friendly structure.  Additional utilities can be added as the
-project evolves.
+report‑friendly structure and a small cache for detection results.
+Additional utilities can be added as the project evolves.
 """
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple, Union
+
+try:  # xxhash is much faster than hashlib for large uploads
+    import xxhash  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None
 
 
 def summarise_violations(violations: List[Dict[str, Any]]) -> str:
@@ -20,3 +28,37 @@ def summarise_violations(violations: List[Dict[str, Any]]) -> str:
             f"{v['standard']} {v['citation']}: {v['description']} (confidence {v['confidence']:.2f})"
         )
     return "\n".join(lines)
+
+
+def content_hash(data: Union[bytes, bytearray, memoryview]) -> Tuple[int, int]:
+    """Return a cache key identifying ``data`` by length and 128-bit hash."""
+    if xxhash is not None:
+        digest = xxhash.xxh3_128_intdigest(data)
+    else:
+        digest = int.from_bytes(hashlib.blake2b(data, digest_size=16).digest(), "little")
+    return len(data), digest
+
+
+class ResultCache:
+    """Thread-safe LRU cache of detection results keyed by upload content."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[int, int], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        """Return the cached result for ``key``, or ``None`` on a miss."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: Tuple[int, int], result: Dict[str, Any]) -> None:
+        """Store ``result``, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
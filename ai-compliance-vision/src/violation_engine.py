@@ -13,56 +13,80 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence
 
 import numpy as np  # type: ignore
 
+try:  # orjson parses several times faster than the standard library
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+from ._proximity import pairs_below, warmup as _warmup_proximity
+
 
 class ViolationEngine:
     """Load standard mappings and evaluate detections."""
 
+    # Maximum distance in pixels between person and forklift centres before
+    # a proximity violation is reported.  You might tune this based on camera
+    # resolution and physical scale.
+    PROXIMITY_THRESHOLD = 200.0
+
     def __init__(self, standards_dir: str) -> None:
         self.standards: Dict[str, Dict[str, Any]] = {}
+        # Inverted index from condition to matching standard entries
+        self._by_condition: Dict[str, List[Dict[str, Any]]] = {}
+        self._has_proximity_rule = False
         self._load_standards(Path(standards_dir))
+        # Compile the proximity kernel now rather than on the first request
+        # that contains both a person and a forklift
+        if self._has_proximity_rule:
+            _warmup_proximity()
 
     def _load_standards(self, directory: Path) -> None:
         for json_file in directory.glob("*.json"):
-            with open(json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if orjson is not None:
+                data = orjson.loads(json_file.read_bytes())
+            else:
+                with open(json_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
             # Store mapping keyed by standard name (filename without ext)
             standard_name = json_file.stem.lower()
             self.standards[standard_name] = data
+        self._build_index()
 
-    def _lookup_condition(self, condition: str) -> List[Dict[str, Any]]:
-        """Return all standard entries matching the given condition."""
-        matches: List[Dict[str, Any]] = []
+    def _build_index(self) -> None:
+        """Precompute the matches for every condition in the loaded standards."""
+        self._by_condition = {}
         for std_name, mapping in self.standards.items():
             for citation, entry in mapping.items():
                 # Each entry must contain `condition` and `description`
-                if entry.get("condition") == condition:
-                    matches.append({
-                        "standard": std_name.upper(),
-                        "citation": citation,
-                        "description": entry.get("description", ""),
-                        "severity": entry.get("severity", ""),
-                    })
-        return matches
+                condition = entry.get("condition")
+                if condition is None:
+                    continue
+                self._by_condition.setdefault(condition, []).append({
+                    "standard": std_name.upper(),
+                    "citation": citation,
+                    "description": entry.get("description", ""),
+                    "severity": entry.get("severity", ""),
+                })
+        self._has_proximity_rule = bool(self._by_condition.get("forklift_pedestrian_proximity"))
 
-    @staticmethod
-    def _bbox_center(bbox: List[float]) -> Tuple[float, float]:
-        x1, y1, x2, y2 = bbox
-        return ((x1 + x2) / 2.0, (y1 + y2) / 2.0)
+    def _lookup_condition(self, condition: str) -> Sequence[Dict[str, Any]]:
+        """Return all standard entries matching the given condition.
 
-    @staticmethod
-    def _euclidean_distance(p1: Tuple[float, float], p2: Tuple[float, float]) -> float:
-        return float(np.sqrt((p1[0] - p2[0]) ** 2 + (p1[1] - p2[1]) ** 2))
+        The returned entries are shared between calls and must not be
+        modified.
+        """
+        return self._by_condition.get(condition, ())
 
-    def evaluate(self, detections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Evaluate a list of detections and return potential violations.
+    def evaluate(self, detections: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Evaluate detections and return potential violations.
 
         Args:
-            detections: List of detection dictionaries as returned by the
-                detection module.
+            detections: Column-oriented detections as returned by the
+                detection module (see `detect.Detections`).
 
         Returns:
             List of violation dictionaries.  Each violation dictionary
@@ -70,49 +94,64 @@ class ViolationEngine:
             `confidence` and optionally `evidence` or other metadata.
         """
         violations: List[Dict[str, Any]] = []
+        bboxes = detections["bboxes"]
+        conditions = detections["conditions"]
+        class_names = detections["class_names"]
+        # Convert the arrays to Python values once for all violations
+        confidences = detections["confidences"].tolist()
+        bbox_list = bboxes.tolist()
+        # Persons and forklifts are only collected if a standard defines the
+        # proximity condition
+        track_proximity = self._has_proximity_rule
+        persons: List[int] = []
+        forklifts: List[int] = []
 
         # Evaluate individual detections
-        for det in detections:
-            condition = det["condition"]
+        for i, condition in enumerate(conditions):
+            if track_proximity:
+                if condition == "person":
+                    persons.append(i)
+                elif condition == "forklift":
+                    forklifts.append(i)
             matches = self._lookup_condition(condition)
             for match in matches:
                 violations.append({
                     **match,
-                    "confidence": det["confidence"],
+                    "confidence": confidences[i],
                     "evidence": {
-                        "bbox": det["bbox"],
-                        "class_name": det["class_name"],
+                        "bbox": bbox_list[i],
+                        "class_name": class_names[i],
                     },
                 })
 
         # Evaluate proximity between person and forklift
-        persons = [d for d in detections if d["condition"] == "person"]
-        forklifts = [d for d in detections if d["condition"] == "forklift"]
         if persons and forklifts:
-            # Compute distances and check for close proximity
-            for person in persons:
-                p_center = self._bbox_center(person["bbox"])
-                for forklift in forklifts:
-                    f_center = self._bbox_center(forklift["bbox"])
-                    distance = self._euclidean_distance(p_center, f_center)
-                    # Use a simple threshold; you might tune this based on
-                    # camera resolution and physical scale
-                    threshold = 200.0
-                    if distance < threshold:
-                        # Create a synthetic condition
-                        condition = "forklift_pedestrian_proximity"
-                        matches = self._lookup_condition(condition)
-                        for match in matches:
-                            # The confidence for proximity is the minimum
-                            # confidence of the two contributing detections
-                            confidence = min(person["confidence"], forklift["confidence"])
-                            violations.append({
-                                **match,
-                                "confidence": confidence,
-                                "evidence": {
-                                    "person_bbox": person["bbox"],
-                                    "forklift_bbox": forklift["bbox"],
-                                },
-                            })
+            matches = self._lookup_condition("forklift_pedestrian_proximity")
+            # Find all close person/forklift pairs in one call, comparing
+            # squared distances to avoid the sqrt
+            p_centers = _bbox_centers(bboxes[persons])
+            f_centers = _bbox_centers(bboxes[forklifts])
+            threshold = self.PROXIMITY_THRESHOLD
+            pairs = pairs_below(p_centers, f_centers, threshold * threshold)
+            for pi, fi in zip(*pairs):
+                person = persons[pi]
+                forklift = forklifts[fi]
+                # The confidence for proximity is the minimum confidence of
+                # the two contributing detections
+                confidence = min(confidences[person], confidences[forklift])
+                for match in matches:
+                    violations.append({
+                        **match,
+                        "confidence": confidence,
+                        "evidence": {
+                            "person_bbox": bbox_list[person],
+                            "forklift_bbox": bbox_list[forklift],
+                        },
+                    })
 
         return violations
+
+
+def _bbox_centers(bboxes: np.ndarray) -> np.ndarray:
+    """Return the (N, 2) centres of (N, 4) xyxy boxes."""
+    return (bboxes[:, :2] + bboxes[:, 2:]) * 0.5
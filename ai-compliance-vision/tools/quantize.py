@@ -0,0 +1,47 @@
+"""Quantize YOLO weights to INT8 for faster inference.
+
+Builds an INT8 TensorRT engine (``<name>.int8.engine``) on machines with a
+CUDA device, or an INT8 OpenVINO model (``<name>_int8_openvino_model``) for
+CPUs with VNNI support.  The output is written next to the weights file and
+is picked up automatically by `load_model`.
+
+INT8 calibration needs a small set of representative images described by a
+dataset YAML in the usual YOLO format.
+
+Usage::
+
+    python -m tools.quantize models/yolov8n.pt --data calib.yaml
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import torch  # type: ignore
+
+from src.detect import export_engine, export_openvino
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("weights", help="Path to the .pt weights file.")
+    parser.add_argument(
+        "--data", required=True, help="Dataset YAML with calibration images."
+    )
+    parser.add_argument(
+        "--format",
+        choices=["engine", "openvino"],
+        default="engine" if torch.cuda.is_available() else "openvino",
+        help="Export target (default: engine on CUDA hosts, otherwise openvino).",
+    )
+    args = parser.parse_args()
+
+    if args.format == "engine":
+        output = export_engine(args.weights, int8=True, calib_data=args.data)
+    else:
+        output = export_openvino(args.weights, int8=True, calib_data=args.data)
+    print(f"INT8 model written to {output}")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()